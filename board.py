@@ -9,7 +9,8 @@ Implements a basic Go board with functions to:
 The board uses a 1-dimensional representation with padding
 """
 import numpy as np
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, Set, Tuple
 
 from board_base import (
     board_array_size,
@@ -28,6 +29,23 @@ from board_base import (
     GO_COLOR,
     GO_POINT,
 )
+
+
+@lru_cache(maxsize=None)
+def _coord_tables(size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Read-only tables of the row and column of each point
+    for a board of the given size.
+    """
+    NS = size + 1
+    points = np.arange(board_array_size(size), dtype=GO_POINT)
+    row_of = points // NS
+    col_of = points % NS
+    row_of.flags.writeable = False
+    col_of.flags.writeable = False
+    return row_of, col_of
+
+
 """
 The GoBoard class implements a board and basic functions to play
 moves, check the end of the game, and count the acore at the end.
@@ -133,6 +151,11 @@ class GoBoard(object):
         self.maxpoint: int = board_array_size(size)
         self.board: np.ndarray[GO_POINT] = np.full(self.maxpoint, BORDER, dtype=GO_POINT)
         self._initialize_empty_points(self.board)
+        self.empty_count: int = size * size
+        # the empty points, i.e. the legal moves, kept up to date by play_move
+        self._legal_set: Set[int] = set(self.get_empty_points().tolist())
+        # row and column of each point, shared by all boards of this size
+        self._row_of, self._col_of = _coord_tables(size)
         self.calculate_rows_cols_diags()
         self.black_captures = 0
         self.white_captures = 0
@@ -147,6 +170,8 @@ class GoBoard(object):
         b.current_player = self.current_player
         assert b.maxpoint == self.maxpoint
         b.board = np.copy(self.board)
+        b.empty_count = self.empty_count
+        b._legal_set = set(self._legal_set)
         return b
 
     def get_color(self, point: GO_POINT) -> GO_COLOR:
@@ -199,6 +224,20 @@ class GoBoard(object):
         """
         return where1d(self.board == EMPTY)
 
+    def legal_points(self) -> List[int]:
+        """
+        Return:
+            The legal moves, i.e. the empty points, in increasing order
+        """
+        return sorted(self._legal_set)
+
+    def coords_of(self, points: List[int]) -> List[Tuple[int, int]]:
+        """
+        Return:
+            The (row, col) coordinates of the given points
+        """
+        return list(zip(self._row_of[points].tolist(), self._col_of[points].tolist()))
+
     def row_start(self, row: int) -> int:
         assert row >= 1
         assert row <= self.size
@@ -329,6 +368,8 @@ class GoBoard(object):
         if self.board[point] != EMPTY:
             return False
         self.board[point] = color
+        self.empty_count -= 1
+        self._legal_set.discard(point)
         self.current_player = opponent(color)
         self.last2_move = self.last_move
         self.last_move = point
@@ -338,6 +379,9 @@ class GoBoard(object):
             if self.board[point+offset] == O and self.board[point+(offset*2)] == O and self.board[point+(offset*3)] == color:
                 self.board[point+offset] = EMPTY
                 self.board[point+(offset*2)] = EMPTY
+                self.empty_count += 2
+                self._legal_set.add(point+offset)
+                self._legal_set.add(point+(offset*2))
                 if color == BLACK:
                     self.black_captures += 2
                 else:
@@ -22,15 +22,11 @@ class GoBoardUtil(object):
             a GoBoard
         color:
             the color to generate the move for.
+
+        Every empty point is legal, so the moves are read from the set
+        of empty points the board maintains instead of trying each one.
         """
-        moves: np.ndarray[GO_POINT] = board.get_empty_points()
-        # TODO use generator instead.
-        legal_moves: List[GO_POINT] = []
-        # TODO use generator instead.
-        for move in moves:
-            if board.is_legal(move, color):
-                legal_moves.append(move)
-        return legal_moves
+        return board.legal_points()
 
     @staticmethod
     def generate_random_move(board: GoBoard, color: GO_COLOR, 
@@ -4,11 +4,12 @@ Module for playing games of Go using GoTextProtocol
 
 """
 import traceback
+from functools import lru_cache
 import numpy as np
 import re
 import random
 from sys import stdin, stdout, stderr
-from typing import Any, Callable, Dict, List, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
 from board_base import (
     BLACK,
@@ -18,13 +19,48 @@ from board_base import (
     GO_COLOR, GO_POINT,
     PASS,
     MAXSIZE,
+    board_array_size,
     coord_to_point,
     opponent
 )
 from board import GoBoard
 from board_util import GoBoardUtil
 from engine import GoEngine
+from patterns_numba import makes_five, scan_capture_xoo, scan_xooox
 
+# GTP color arguments
+_COLOR_MAP: Dict[str, GO_COLOR] = {"b": BLACK, "w": WHITE, "black": BLACK, "white": WHITE}
+
+# color codes understood by color_to_int
+_COLOR_CODES: Dict[str, GO_COLOR] = {"b": BLACK, "w": WHITE, "e": EMPTY, "BORDER": BORDER}
+
+# GTP column letters, which skip "I", and their column numbers
+assert MAXSIZE <= 25
+_COLUMN_LETTERS = "ABCDEFGHJKLMNOPQRSTUVWXYZ"
+_GTP_COL: Dict[int, int] = {ord(c): i for i, c in enumerate(_COLUMN_LETTERS.lower(), start=1)}
+
+# commands whose *_cmd methods are still empty stubs; get_cmd answers
+# them directly. Remove a command from here once it is implemented.
+_UNIMPLEMENTED_COMMANDS = frozenset({"timelimit", "solve"})
+
+# command ids prefixed to regression test commands
+_LEADING_DIGITS_RE = re.compile(r"^\d+")
+
+# character shown for each point color by gogui-rules_board
+_BOARD_CHAR_TABLE = np.full(256, ord("?"), dtype=np.uint8)
+_BOARD_CHAR_TABLE[BLACK] = ord("X")
+_BOARD_CHAR_TABLE[WHITE] = ord("O")
+_BOARD_CHAR_TABLE[EMPTY] = ord(".")
+
+# move categories of the rule-based policy, see GtpConnection._classify_move
+_WIN_FIVE = 1
+_WIN_CAPTURE = 2
+_BLOCK_WIN = 4
+_OPEN_FOUR = 8
+_XOO = 16
+_XOOO = 32
+_WIN = _WIN_FIVE | _WIN_CAPTURE
+_CAPTURE = _XOO | _XOOO
 
 
 class GtpConnection:
@@ -42,6 +78,12 @@ class GtpConnection:
         self._debug_mode: bool = debug_mode
         self.go_engine = go_engine
         self.board: GoBoard = board
+        # compile the pattern kernels now rather than on the first policy call
+        scan_capture_xoo(board.board, board.size, board.NS + 1, BLACK)
+        scan_xooox(board.board, board.size, board.NS + 1, BLACK)
+        makes_five(board.board, board.size, board.NS + 1, BLACK)
+        self._rng = np.random.default_rng()
+        self._fmt_table: Tuple[str, ...] = _get_format_table(board.size)
         
         self.policytype = "random"
         
@@ -97,11 +139,25 @@ class GtpConnection:
         """
         Start a GTP connection. 
         This function continuously monitors standard input for commands.
+        Input is read in large chunks and split into lines here,
+        instead of one readline call per command.
+        Responses are flushed once per chunk, before waiting for more input.
         """
-        line = stdin.readline()
-        while line:
-            self.get_cmd(line)
-            line = stdin.readline()
+        raw = stdin.buffer
+        buf = b""
+        while True:
+            self.flush()
+            chunk = raw.read1(65536)
+            if not chunk:
+                break
+            lines = (buf + chunk).split(b"\n")
+            # keep an incomplete last line for the next chunk
+            buf = lines.pop()
+            for line in lines:
+                self.get_cmd(line.decode("utf-8", "replace") + "\n")
+        if buf:
+            self.get_cmd(buf.decode("utf-8", "replace"))
+        self.flush()
 
     def get_cmd(self, command: str) -> None:
         """
@@ -113,36 +169,32 @@ class GtpConnection:
             return
         # Strip leading numbers from regression tests
         if command[0].isdigit():
-            command = re.sub("^\d+", "", command).lstrip()
+            command = _LEADING_DIGITS_RE.sub("", command).lstrip()
 
         elements: List[str] = command.split()
         if not elements:
             return
         command_name: str = elements[0]
-        args: List[str] = elements[1:]
-        if self.has_arg_error(command_name, len(args)):
+        if command_name in _UNIMPLEMENTED_COMMANDS:
+            self.respond()
             return
-        if command_name in self.commands:
-            try:
-                self.commands[command_name](args)
-            except Exception as e:
-                self.debug_msg("Error executing command {}\n".format(str(e)))
-                self.debug_msg("Stack Trace:\n{}\n".format(traceback.format_exc()))
-                raise e
-        else:
+        args: List[str] = elements[1:]
+        handler = self.commands.get(command_name)
+        if handler is None:
             self.debug_msg("Unknown command: {}\n".format(command_name))
             self.error("Unknown command")
-            stdout.flush()
-
-    def has_arg_error(self, cmd: str, argnum: int) -> bool:
-        """
-        Verify the number of arguments of cmd.
-        argnum is the number of parsed arguments
-        """
-        if cmd in self.argmap and self.argmap[cmd][0] != argnum:
-            self.error(self.argmap[cmd][1])
-            return True
-        return False
+            return
+        # verify the number of arguments
+        spec = self.argmap.get(command_name)
+        if spec is not None and spec[0] != len(args):
+            self.error(spec[1])
+            return
+        try:
+            handler(args)
+        except Exception as e:
+            self.debug_msg("Error executing command {}\n".format(str(e)))
+            self.debug_msg("Stack Trace:\n{}\n".format(traceback.format_exc()))
+            raise e
 
     def debug_msg(self, msg: str) -> None:
         """ Write msg to the debug stream """
@@ -153,18 +205,19 @@ class GtpConnection:
     def error(self, error_msg: str) -> None:
         """ Send error msg to stdout """
         stdout.write("? {}\n\n".format(error_msg))
-        stdout.flush()
 
     def respond(self, response: str = "") -> None:
         """ Send response to stdout """
         stdout.write("= {}\n\n".format(response))
-        stdout.flush()
 
     def reset(self, size: int) -> None:
         """
         Reset the board to empty board of given size
         """
+        # build the table first, so that a failure leaves the old size intact
+        fmt_table = _get_format_table(size)
         self.board.reset(size)
+        self._fmt_table = fmt_table
 
     def board2d(self) -> str:
         return str(GoBoardUtil.get_twoD_board(self.board))
@@ -195,7 +248,12 @@ class GtpConnection:
         """
         Reset the game with new boardsize args[0]
         """
-        self.reset(int(args[0]))
+        size = int(args[0])
+        # GoBoard.calculate_rows_cols_diags needs at least 5 rows
+        if not 5 <= size <= MAXSIZE:
+            self.error("unacceptable size")
+            return
+        self.reset(size)
         self.respond()
 
     def showboard_cmd(self, args: List[str]) -> None:
@@ -227,27 +285,14 @@ class GtpConnection:
         List legal moves for color args[0] in {'b','w'}
         """
         board_color: str = args[0].lower()
-        color: GO_COLOR = color_to_int(board_color)
+        color: GO_COLOR = _COLOR_MAP[board_color]
         moves: List[GO_POINT] = GoBoardUtil.generate_legal_moves(self.board, color)
-        gtp_moves: List[Tuple[int, int]] = []
-        for move in moves:
-            coords: Tuple[int, int] = point_to_coord(move, self.board.size)
-            gtp_moves.append(coords)
-        return gtp_moves
+        return self.board.coords_of(moves)
     
 
-    def legal_moves(self, color: GO_COLOR):
-        moves: List[GO_POINT] = GoBoardUtil.generate_legal_moves(self.board, color)
-        gtp_moves: List[str] = []
-
-
-        for move in moves:
-            coords: Tuple[int, int] = point_to_coord(move, self.board.size)
-
-            gtp_moves.append(format_point(coords).lower())
-
-        sorted_moves = sorted(gtp_moves)
-        return sorted_moves
+    def legal_moves(self, color: GO_COLOR) -> List[str]:
+        fmt_table = self._fmt_table
+        return sorted(fmt_table[move] for move in GoBoardUtil.generate_legal_moves(self.board, color))
 
 
     """
@@ -286,38 +331,28 @@ class GtpConnection:
     def gogui_rules_board_cmd(self, args: List[str]) -> None:
         """ We already implemented this function for Assignment 2 """
         size = self.board.size
-        str = ''
+        rows = []
         for row in range(size-1, -1, -1):
             start = self.board.row_start(row + 1)
-            for i in range(size):
-                #str += '.'
-                point = self.board.board[start + i]
-                if point == BLACK:
-                    str += 'X'
-                elif point == WHITE:
-                    str += 'O'
-                elif point == EMPTY:
-                    str += '.'
-                else:
-                    assert False
-            str += '\n'
-        self.respond(str)
+            rows.append(self.board.board[start : start + size])
+        chars = _BOARD_CHAR_TABLE[np.concatenate(rows)].tobytes().decode()
+        board_str = "\n".join(chars[i : i + size] for i in range(0, len(chars), size))
+        self.respond(board_str + "\n")
 
 
     def gogui_rules_final_result_cmd(self, args: List[str]) -> None:
         """ We already implemented this function for Assignment 2 """
-        result1 = self.board.detect_five_in_a_row()
-        result2 = EMPTY
+        # Check the capture counts first, the five in a row scan is
+        # only needed if black has not already won by captures
         if self.board.get_captures(BLACK) >= 10:
-            result2 = BLACK
-        elif self.board.get_captures(WHITE) >= 10:
-            result2 = WHITE
-
-        if (result1 == BLACK) or (result2 == BLACK):
             self.respond("black")
-        elif (result1 == WHITE) or (result2 == WHITE):
+            return
+        result = self.board.detect_five_in_a_row()
+        if result == BLACK:
+            self.respond("black")
+        elif (result == WHITE) or (self.board.get_captures(WHITE) >= 10):
             self.respond("white")
-        elif self.board.get_empty_points().size == 0:
+        elif self.board.empty_count == 0:
             self.respond("draw")
         else:
             self.respond("unknown")
@@ -330,26 +365,24 @@ class GtpConnection:
             (self.board.get_captures(WHITE) >= 10):
             self.respond("")
             return
-        legal_moves = self.board.get_empty_points()
-        gtp_moves: List[str] = []
-        for move in legal_moves:
-            coords: Tuple[int, int] = point_to_coord(move, self.board.size)
-            gtp_moves.append(format_point(coords))
-        sorted_moves = " ".join(sorted(gtp_moves))
-        self.respond(sorted_moves)
+        fmt_table = self._fmt_table
+        # lowercase and uppercase move strings sort in the same order,
+        # so the joined result is converted to uppercase in one call
+        sorted_moves = " ".join(sorted(fmt_table[move] for move in self.board.get_empty_points()))
+        self.respond(sorted_moves.upper())
 
     def play_cmd(self, args: List[str]) -> None:
         """ We already implemented this function for Assignment 2 """
         try:
             board_color = args[0].lower()
             board_move = args[1]
-            if board_color not in ['b', 'w']:
+            color = _COLOR_MAP.get(board_color)
+            if color is None:
                 self.respond('illegal move: "{} {}" wrong color'.format(board_color, board_move))
                 return
-            coord = move_to_coord(args[1], self.board.size)
-            move = coord_to_point(coord[0], coord[1], self.board.size)
+            row, col = move_to_coord(args[1], self.board.size)
+            move = coord_to_point(row, col, self.board.size)
             
-            color = color_to_int(board_color)
             if not self.board.play_move(move, color):
                 # self.respond("Illegal Move: {}".format(board_move))
                 self.respond('illegal move: "{} {}" occupied'.format(board_color, board_move))
@@ -360,8 +393,7 @@ class GtpConnection:
                     "Move: {}\nBoard:\n{}\n".format(board_move, self.board2d())
                 )
             if len(args) > 2 and args[2] == 'print_move':
-                move_as_string = format_point(coord)
-                self.respond(move_as_string.lower())
+                self.respond(self._fmt_table[move])
             else:
                 self.respond()
         except Exception as e:
@@ -397,185 +429,128 @@ class GtpConnection:
         Generate moves based on the set policy type.
         """
         current_ply = self.board.current_player
-        moves = self.legal_moves(current_ply)
 
         if self.policytype == "random":
             random_move = self.get_random_move()
-            return "Random", random_move
+            return "Random", self.format_moves(random_move)
         elif self.policytype == "rule_based":
-            
-            win_moves = self.get_winning_moves(self.board, self.board.current_player)
-            block_win_moves = self.get_block_win_moves(self.board, self.board.current_player)
-            open_four_moves = self.get_open_four_moves(self.board, self.board.current_player)
-            capture_moves = self.find_capture_pattern_in_one_move(self.board, self.board.current_player)
-        
-            
+            # Classify all legal moves in a single pass. Once a move of
+            # some category is found, lower categories can no longer be
+            # returned and are not checked for the remaining moves.
+            legal = GoBoardUtil.generate_legal_moves(self.board, current_ply)
+            five_on_board = self.board.detect_five_in_a_row()
+            win_moves: List[GO_POINT] = []
+            capture_win_moves: List[GO_POINT] = []
+            block_win_moves: List[GO_POINT] = []
+            open_four_moves: List[GO_POINT] = []
+            capture_moves: List[GO_POINT] = []
+            wanted = _WIN | _BLOCK_WIN | _OPEN_FOUR | _CAPTURE
+            for move in legal:
+                kind = self._classify_move(self.board, move, current_ply, wanted, five_on_board)
+                if kind & _WIN_FIVE:
+                    win_moves.append(move)
+                if kind & _WIN_CAPTURE:
+                    capture_win_moves.append(move)
+                if kind & _WIN:
+                    wanted = _WIN
+                # a capture also blocks once any other blocking move is found
+                elif kind & _BLOCK_WIN or (block_win_moves and kind & _XOO):
+                    block_win_moves.append(move)
+                    wanted &= _WIN | _BLOCK_WIN | _XOO
+                elif kind & _OPEN_FOUR:
+                    open_four_moves.append(move)
+                    wanted &= _WIN | _BLOCK_WIN | _OPEN_FOUR | _XOO
+                elif kind & _CAPTURE:
+                    # listed once for each of the "XOO." and "XOOO."
+                    # patterns the move completes
+                    if kind & _XOO:
+                        capture_moves.append(move)
+                    if kind & _XOOO:
+                        capture_moves.append(move)
+
+            win_moves += capture_win_moves
             if win_moves:
-                return "Win", win_moves
+                return "Win", self.format_moves(win_moves)
             # Check for block win moves
-            elif block_win_moves:
-                return "BlockWin", block_win_moves
+            if block_win_moves:
+                return "BlockWin", self.format_moves(block_win_moves)
             # Check for open four moves
-            elif open_four_moves:
-                return "OpenFour", open_four_moves
+            if open_four_moves:
+                return "OpenFour", self.format_moves(open_four_moves)
             # Check for capture moves
-            elif capture_moves:
-                return "Capture", capture_moves
-            else:
-                return "Random", ["k", "k"]
+            if capture_moves:
+                return "Capture", self.format_moves(capture_moves)
+            return "Random", ["k", "k"]
         else:
            
             raise ValueError("Invalid policy type")
-    def find_capture_pattern_in_one_move(self, board: GoBoard, color: GO_COLOR) -> List[str]:
-        capture_moves = []
-
-        for move in GoBoardUtil.generate_legal_moves(board, color):
-            captured_stones = self.check_capture_pattern(board, move, color)
-            xooox = self.XOOOX(board,move, color)
-
-            if captured_stones:
-                coords: Tuple[int, int] = point_to_coord(move, board.size)
-                capture_moves.append(format_point(coords).lower())
-            if xooox:
-                coords: Tuple[int, int] = point_to_coord(move, board.size)
-                capture_moves.append(format_point(coords).lower())
-
-        return capture_moves
 
-        
-
-    def check_capture_pattern(self, board: GoBoard, move: GO_POINT, color: GO_COLOR):
-        x, y = point_to_coord(move, board.size)
-        opp = opponent(color)
-        captures = []
-    # Check horizontally for "XOO."
-        if (board.size >= x-3>=0) :
-            move1 = coord_to_point(x-3, y, self.board.size) #X
-            move2 = coord_to_point(x-2, y, self.board.size)  #O
-            move3 = coord_to_point(x-1, y, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(xmove) == 0:
-                captures.append(xmove) #XOO.
-        if ( board.size >= x+3 >=0):
-            move1 = coord_to_point(x+3, y, self.board.size) #X
-            move2 = coord_to_point(x+2, y, self.board.size)  #O
-            move3 = coord_to_point(x+1, y, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-
-            if (board.get_color(move1) == color ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(xmove) == 0:
-                captures.append(xmove) #XOO.
-    
-    # Check vertically for "XOO."
-        if (board.size >= y-3>=0):
-            move1 = coord_to_point(x, y-3, self.board.size) #X
-            move2 = coord_to_point(x, y-2, self.board.size)  #O
-            move3 = coord_to_point(x, y-1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-
-            if (board.get_color(move1) == color ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(xmove) == 0:
-                captures.append(xmove) #XOO.
-        if (board.size >= y+3 >=0):
-            move1 = coord_to_point(x, y+3, self.board.size) #X
-            move2 = coord_to_point(x, y+2, self.board.size)  #O
-            move3 = coord_to_point(x, y+1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-
-            if (board.get_color(move1) == color ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(xmove) == 0:
-                captures.append(xmove) #XOO.
-
-    # Check diagonally for "XOO."
-        if (board.size >= x-3>=0 and board.size >= y-3>=0) :
-            move1 = coord_to_point(x-3, y-3, self.board.size) #X
-            move2 = coord_to_point(x-2, y-2, self.board.size)  #O
-            move3 = coord_to_point(x-1, y-1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-
-            if (board.get_color(move1) == color ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(xmove) == 0:
-                captures.append(xmove) #XOO.
-        if (board.size >= x+3 >= 0 and board.size >= y-3 >=0):
-            move1 = coord_to_point(x+3, y-3, self.board.size) #X
-            move2 = coord_to_point(x+2, y-2, self.board.size)  #O
-            move3 = coord_to_point(x+1, y-1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-
-            if (board.get_color(move1) == color ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(xmove) == 0:
-                captures.append(xmove) #XOO.
-
-    # Check diagonally for ".OOX"
-        if (board.size >= x-3>=0 and board.size >= y+3 >=0) :
-            move1 = coord_to_point(x-3, y+3, self.board.size) #X
-            move2 = coord_to_point(x-2, y+2, self.board.size)  #O
-            move3 = coord_to_point(x-1, y+1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
+    def _classify_move(self, board: GoBoard, move: GO_POINT, color: GO_COLOR,
+                       wanted: int, five_on_board: GO_COLOR) -> int:
+        """
+        Return the bitmask of rule-based policy categories of move for color.
+        Only the categories in wanted are checked and returned.
+        five_on_board is board.detect_five_in_a_row() before the move.
+        """
+        b = board.board
+        size = board.size
+        kind = 0
+        xoo = scan_capture_xoo(b, size, move, color)
+        if xoo:
+            kind |= _XOO
+        if scan_xooox(b, size, move, color):
+            kind |= _XOOO
+        if wanted & _WIN:
+            if five_on_board == EMPTY:
+                five = makes_five(b, size, move, color)
+            else:
+                # detect_five_in_a_row may report the existing five first
+                board_copy = board.copy()
+                board_copy.play_move(move, color)
+                five = board_copy.detect_five_in_a_row() == color
+            if five:
+                kind |= _WIN_FIVE
+            # board.copy() does not carry over the capture counts, so only
+            # the stones captured by the move itself are counted
+            if 2 * bin(xoo).count("1") >= 10:
+                kind |= _WIN_CAPTURE
+        if wanted & _BLOCK_WIN:
+            opp = opponent(color)
+            captured = board.get_captures(opp)
+            if (self.check_four_pattern(board, move, color)
+                    or kind & _XOOO
+                    or (captured >= 8 and scan_capture_xoo(b, size, move, opp))
+                    or (captured >= 7 and scan_xooox(b, size, move, opp))):
+                kind |= _BLOCK_WIN
+        if wanted & _OPEN_FOUR and self.check_open_four_moves(board, move, color):
+            kind |= _OPEN_FOUR
+        return kind & wanted
+
+    def format_moves(self, moves: Iterable[GO_POINT]) -> List[str]:
+        """
+        Convert points to lowercase GTP move strings.
+        The policy helpers work on points; this is done only once,
+        on the moves that generate_policy_moves returns.
+        """
+        fmt_table = self._fmt_table
+        return [fmt_table[move] for move in moves]
 
-            if (board.get_color(move1) == color ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(xmove) == 0:
-                captures.append(xmove) #XOO.
-        if (board.size >= x+3 >= 0 and board.size >= y+3 >=0 ):
-            move1 = coord_to_point(x+3, y+3, self.board.size) #X
-            move2 = coord_to_point(x+2, y+2, self.board.size)  #O
-            move3 = coord_to_point(x+1, y+1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
+    def check_capture_pattern(self, board: GoBoard, move: GO_POINT, color: GO_COLOR) -> int:
+        """
+        Check for "XOO." capture patterns, where move is the empty point
+        and X is a stone of color. Returns a bitmask of matching directions.
+        """
+        return scan_capture_xoo(board.board, board.size, move, color)
 
-            if (board.get_color(move1) == color ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(xmove) == 0:
-                captures.append(xmove) #XOO.
-        return captures
-        
-        
-        
-    def get_random_move(self) -> List[str]:
+    def get_random_move(self) -> List[GO_POINT]:
         # args = ["b"]  # or ["w"], depending on the current player
         # legal_moves = self.legal_moves_cmd(args)
-        current_player = self.board.current_player
-        current_player_str = "b" if current_player == BLACK else "w"
-    
-        args = [current_player_str]
-        legal_moves = self.legal_moves_cmd(args)
+        legal_moves = GoBoardUtil.generate_legal_moves(self.board, self.board.current_player)
         
         # Choose multiple random moves from the list
         num_moves = min(len(legal_moves), 10)  # Number of moves to choose, you can adjust this
-        random_moves = random.sample(legal_moves, num_moves)
-        
-        # Convert moves to their string representation
-        formatted_moves = [format_point(move).lower() for move in random_moves]
-        return formatted_moves
+        return self._rng.choice(legal_moves, size=num_moves, replace=False).tolist()
             
-    def get_block_win_moves(self, board: GoBoard, color: GO_COLOR) -> list:
-        block_moves = []
-        opp = opponent(color)
-        if color == WHITE:
-            captured = board.black_captures
-        if color == BLACK:
-            captured = board.white_captures
-
-        for move in GoBoardUtil.generate_legal_moves(board, color):
-            blocked_stones = self.check_four_pattern(board, move, color) #case 1
-            captured_stones = self.check_capture_pattern(board,move,color) #case 2
-            capture_threat = self.check_capture_pattern(board,move,opp) #case 3
-            xooox = self.XOOOX(board,move, color) #case2 
-            seven = self.XOOOX(board,move, opp)
-            
-            if blocked_stones:
-                coords: Tuple[int, int] = point_to_coord(move, board.size)
-                block_moves.append(format_point(coords).lower())
-            if xooox:
-                coords: Tuple[int, int] = point_to_coord(move, board.size)
-                block_moves.append(format_point(coords).lower())
-            
-            if block_moves:
-                if captured_stones: #case 2
-                    coords: Tuple[int, int] = point_to_coord(move, board.size)
-                    block_moves.append(format_point(coords).lower())
-            if captured >= 8:
-                if capture_threat:
-                    coords: Tuple[int, int] = point_to_coord(move, board.size)
-                    block_moves.append(format_point(coords).lower())
-            if captured >= 7:
-                if seven:
-                    coords: Tuple[int, int] = point_to_coord(move, board.size)
-                    block_moves.append(format_point(coords).lower())
-        block_moves = list(set(block_moves))
-
-        return block_moves
     # def XOX(self, board: GoBoard, move: GO_POINT, color: GO_COLOR) -> List[str]:
     #     blcapture = []
     #     x, y = point_to_coord(move, board.size)
@@ -633,78 +608,12 @@ class GtpConnection:
     #             blcapture.append(xmove) #XOO.
     #     return blcapture
     
-    def XOOOX(self, board: GoBoard, move: GO_POINT, color: GO_COLOR) -> List[str]:
-        blcapture = []
-        x, y = point_to_coord(move, board.size)
-        opp = opponent(color)
-        #XOX 
-        if (board.size >= x-4>=0) : #horizontal
-            move1 = coord_to_point(x-4,y, self.board.size) #X
-            move2 = coord_to_point(x-3, y, self.board.size) #O
-            move3 = coord_to_point(x-2, y, self.board.size) #O
-            move4 = coord_to_point(x-1,y, self.board.size)#O
-            xmove = coord_to_point(x, y, self.board.size) #.
-            if (board.get_color(move1) == color ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4)==opp and board.get_color(xmove) == 0:
-                blcapture.append(xmove) #XOO.
-        if (board.size >= x+4>=0) : #horizontal
-            move1 = coord_to_point(x+4,y, self.board.size)
-            move2 = coord_to_point(x+3, y, self.board.size) #X
-            move3 = coord_to_point(x+2, y, self.board.size) #O
-            move4 = coord_to_point(x+1,y, self.board.size)
-            xmove = coord_to_point(x, y, self.board.size) #.
-            if (board.get_color(move1) == color) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4)==opp and board.get_color(xmove) == 0:
-                blcapture.append(xmove) #XOO.
-        if (board.size >= y-4>=0) : #vertical
-            move1 = coord_to_point(x,y-4, self.board.size)
-            move2 = coord_to_point(x, y-3, self.board.size) #X
-            move3 = coord_to_point(x, y-2, self.board.size) #O
-            move4 = coord_to_point(x,y-1, self.board.size)
-            xmove = coord_to_point(x, y, self.board.size) #.
-            if (board.get_color(move1) == color) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4)==opp and board.get_color(xmove) == 0:
-                blcapture.append(xmove) #XOO.
-        if (board.size >=y+4>=0) : #horizontal
-            move1 = coord_to_point(x,y+4, self.board.size)
-            move2 = coord_to_point(x, y+3, self.board.size) #X
-            move3 = coord_to_point(x, y+2, self.board.size) #O
-            move4 = coord_to_point(x,y+1, self.board.size)
-            xmove = coord_to_point(x, y, self.board.size) #.
-            if (board.get_color(move1) == color) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4)==opp and board.get_color(xmove) == 0:
-                blcapture.append(xmove) #XOO.
-        if (board.size >=x-4>=0 and board.size >= y-4>=0) : #horizontal
-            move1 = coord_to_point(x-4,y-4, self.board.size)
-            move2 = coord_to_point(x-3, y-3, self.board.size) #X
-            move3 = coord_to_point(x-2, y-2, self.board.size) #O
-            move4 = coord_to_point(x-1,y-1, self.board.size)
-            xmove = coord_to_point(x, y, self.board.size) #.
-            if (board.get_color(move1) == color) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4)==opp and board.get_color(xmove) == 0:
-                blcapture.append(xmove) #XOO.
-        if (board.size >=x+4>=0 and board.size >= y-4 >=0) : #horizontal
-            move1 = coord_to_point(x+4,y-4, self.board.size)
-            move2 = coord_to_point(x+3, y-3, self.board.size) #X
-            move3 = coord_to_point(x+2, y-2, self.board.size) #O
-            move4 = coord_to_point(x+1,y-1, self.board.size)
-            xmove = coord_to_point(x, y, self.board.size) #.
-            if (board.get_color(move1) == color) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4)==opp and board.get_color(xmove) == 0:
-                blcapture.append(xmove) #XOO.
-
-        if (board.size >= x+4>=0 and board.size >= y+4>=0) : #horizontal
-            move1 = coord_to_point(x+4,y+4, self.board.size)
-            move2 = coord_to_point(x+3, y+3, self.board.size) #X
-            move3 = coord_to_point(x+2, y+2, self.board.size) #O
-            move4 = coord_to_point(x+1,y+1, self.board.size)
-            xmove = coord_to_point(x, y, self.board.size) #.
-            if (board.get_color(move1) == color) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4)==opp and board.get_color(xmove) == 0:
-                blcapture.append(xmove) #XOO.
-
-        if (board.size >= x-4>=0 and board.size >= y+4 >=0) : #horizontal
-            move1 = coord_to_point(x-4,y+4, self.board.size)
-            move2 = coord_to_point(x-3, y+3, self.board.size) #X
-            move3 = coord_to_point(x-2, y+2, self.board.size) #O
-            move4 = coord_to_point(x-1,y+1, self.board.size)
-            xmove = coord_to_point(x, y, self.board.size) #.
-            if (board.get_color(move1) == color) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4)==opp and board.get_color(xmove) == 0:
-                blcapture.append(xmove) #XOO.
-        return blcapture
+    def XOOOX(self, board: GoBoard, move: GO_POINT, color: GO_COLOR) -> int:
+        """
+        Check for "XOOO." patterns, where move is the empty point
+        and X is a stone of color. Returns a bitmask of matching directions.
+        """
+        return scan_xooox(board.board, board.size, move, color)
 
     # def blockwin_capture(self, board: GoBoard, move: GO_POINT, color: GO_COLOR) -> List[str]:
     #     blcapture = []
@@ -722,7 +631,7 @@ class GtpConnection:
     #     #XOOOOX
     #     return blcapture
     
-    def find_capture_threat_moves(self, board: GoBoard,move: GO_POINT, color: GO_COLOR) -> List[str]:
+    def find_capture_threat_moves(self, board: GoBoard,move: GO_POINT, color: GO_COLOR) -> List[GO_POINT]:
         capture_threat_moves = []
 
         opponent_color = opponent(color)
@@ -736,377 +645,349 @@ class GtpConnection:
                 captured_stones = self.check_capture_pattern(board, move, opponent_color)
 
                 if captured_stones:
-                    coords: Tuple[int, int] = point_to_coord(move, board.size)
-                    capture_threat_moves.append(format_point(coords).lower())
+                    capture_threat_moves.append(move)
         if captured >= 7:
             for move in GoBoardUtil.generate_legal_moves(board, opponent_color):
                 captured_stones = self.XOOOX(board, move, color)
 
                 if captured_stones:
-                    coords: Tuple[int, int] = point_to_coord(move, board.size)
-                    capture_threat_moves.append(format_point(coords).lower())
+                    capture_threat_moves.append(move)
 
         return capture_threat_moves
     
     def check_four_pattern(self, board: GoBoard, move: GO_POINT, color: GO_COLOR):
-        x, y = point_to_coord(move, board.size)
+        sz = board.size
+        gc = board.get_color
+        NS = board.NS
+        x = move // NS
+        y = move - x * NS
         opp = opponent(color)
         captures = []
     # Check horizontally for four Os
-        if (board.size >=x-4>=0) : #OOOO.
-            move1 = coord_to_point(x-4, y, self.board.size) #O
-            move2 = coord_to_point(x-3, y, self.board.size) #O
-            move3 = coord_to_point(x-2, y, self.board.size)  #O
-            move4 = coord_to_point(x-1, y, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size) #X
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == 0:
+        if (sz >=x-4>=0) : #OOOO.
+            move1 = coord_to_point(x-4, y, sz) #O
+            move2 = coord_to_point(x-3, y, sz) #O
+            move3 = coord_to_point(x-2, y, sz)  #O
+            move4 = coord_to_point(x-1, y, sz)  #O
+            xmove = coord_to_point(x, y, sz) #X
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == 0:
                 captures.append(xmove) #XOO.
 
-        if (board.size >= x+ 4 >=0):
-            move1 = coord_to_point(x+4, y, self.board.size) #O
-            move2 = coord_to_point(x+3, y, self.board.size) #O
-            move3 = coord_to_point(x+2, y, self.board.size)  #O
-            move4 = coord_to_point(x+1, y, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size) #X
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4)==opp and board.get_color(xmove) == 0:
+        if (sz >= x+ 4 >=0):
+            move1 = coord_to_point(x+4, y, sz) #O
+            move2 = coord_to_point(x+3, y, sz) #O
+            move3 = coord_to_point(x+2, y, sz)  #O
+            move4 = coord_to_point(x+1, y, sz)  #O
+            xmove = coord_to_point(x, y, sz) #X
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4)==opp and gc(xmove) == 0:
                 captures.append(xmove) 
 
-        if (board.size >=x-3>=0) and ( board.size >= x+1>=0): #OOO.O
-            move1 = coord_to_point(x-3, y, self.board.size) #O
-            move2 = coord_to_point(x-2, y, self.board.size) #O
-            move3 = coord_to_point(x-1, y, self.board.size)  #O
-            move4 = coord_to_point(x+1, y, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size) #X
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == 0:
+        if (sz >=x-3>=0) and ( sz >= x+1>=0): #OOO.O
+            move1 = coord_to_point(x-3, y, sz) #O
+            move2 = coord_to_point(x-2, y, sz) #O
+            move3 = coord_to_point(x-1, y, sz)  #O
+            move4 = coord_to_point(x+1, y, sz)  #O
+            xmove = coord_to_point(x, y, sz) #X
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == 0:
                 captures.append(xmove) #XOO.
 
-        if (board.size>= x+3 >=0) and (board.size>= x-1 >=0): #O.OOO
-            move1 = coord_to_point(x+1, y, self.board.size) #O
-            move2 = coord_to_point(x+3, y, self.board.size) #O
-            move3 = coord_to_point(x+2, y, self.board.size)  #O
-            move4 = coord_to_point(x-1, y, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size) #X
+        if (sz>= x+3 >=0) and (sz>= x-1 >=0): #O.OOO
+            move1 = coord_to_point(x+1, y, sz) #O
+            move2 = coord_to_point(x+3, y, sz) #O
+            move3 = coord_to_point(x+2, y, sz)  #O
+            move4 = coord_to_point(x-1, y, sz)  #O
+            xmove = coord_to_point(x, y, sz) #X
 
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4)==opp and board.get_color(xmove) == 0:
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4)==opp and gc(xmove) == 0:
                 captures.append(xmove) 
 
-        if (board.size >=x-2>=0) and (board.size>= x+2 >=0): #OO.OO
-            move1 = coord_to_point(x+2, y, self.board.size) #O
-            move2 = coord_to_point(x-2, y, self.board.size) #O
-            move3 = coord_to_point(x-1, y, self.board.size)  #O
-            move4 = coord_to_point(x+1, y, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size) #X
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == 0:
+        if (sz >=x-2>=0) and (sz>= x+2 >=0): #OO.OO
+            move1 = coord_to_point(x+2, y, sz) #O
+            move2 = coord_to_point(x-2, y, sz) #O
+            move3 = coord_to_point(x-1, y, sz)  #O
+            move4 = coord_to_point(x+1, y, sz)  #O
+            xmove = coord_to_point(x, y, sz) #X
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == 0:
                 captures.append(xmove) #XOO.
     
     # Check vertically 
-        if (board.size >=y-4>=0) : #.OOOO
-            move1 = coord_to_point(x, y-4, self.board.size) #O
-            move2 = coord_to_point(x, y-3, self.board.size) #O
-            move3 = coord_to_point(x, y-2, self.board.size)  #O
-            move4 = coord_to_point(x, y-1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size) #X
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == 0:
+        if (sz >=y-4>=0) : #.OOOO
+            move1 = coord_to_point(x, y-4, sz) #O
+            move2 = coord_to_point(x, y-3, sz) #O
+            move3 = coord_to_point(x, y-2, sz)  #O
+            move4 = coord_to_point(x, y-1, sz)  #O
+            xmove = coord_to_point(x, y, sz) #X
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == 0:
                 captures.append(xmove) #XOO.
 
-        if (board.size >=y+4>=0) : #.OOOO
-            move1 = coord_to_point(x, y+4, self.board.size) #O
-            move2 = coord_to_point(x, y+3, self.board.size) #O
-            move3 = coord_to_point(x, y+2, self.board.size)  #O
-            move4 = coord_to_point(x, y+1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size) #X
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == 0:
+        if (sz >=y+4>=0) : #.OOOO
+            move1 = coord_to_point(x, y+4, sz) #O
+            move2 = coord_to_point(x, y+3, sz) #O
+            move3 = coord_to_point(x, y+2, sz)  #O
+            move4 = coord_to_point(x, y+1, sz)  #O
+            xmove = coord_to_point(x, y, sz) #X
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == 0:
                 captures.append(xmove) #XOO.
 
-        if (board.size >= y+2 >=0) and (board.size >= y-2 >=0): #.OOOO
-            move1 = coord_to_point(x, y+2, self.board.size) #O
-            move2 = coord_to_point(x, y+1, self.board.size) #O
-            move3 = coord_to_point(x, y-2, self.board.size)  #O
-            move4 = coord_to_point(x, y-1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size) #X
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == 0:
+        if (sz >= y+2 >=0) and (sz >= y-2 >=0): #.OOOO
+            move1 = coord_to_point(x, y+2, sz) #O
+            move2 = coord_to_point(x, y+1, sz) #O
+            move3 = coord_to_point(x, y-2, sz)  #O
+            move4 = coord_to_point(x, y-1, sz)  #O
+            xmove = coord_to_point(x, y, sz) #X
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == 0:
                 captures.append(xmove) #XOO.
 
-        if (board.size >=y+3>=0) and (board.size >= y-1 >=0) : #.OOOO
-            move1 = coord_to_point(x, y-1, self.board.size) #O
-            move2 = coord_to_point(x, y+3, self.board.size) #O
-            move3 = coord_to_point(x, y+2, self.board.size)  #O
-            move4 = coord_to_point(x, y+1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size) #X
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == EMPTY:
+        if (sz >=y+3>=0) and (sz >= y-1 >=0) : #.OOOO
+            move1 = coord_to_point(x, y-1, sz) #O
+            move2 = coord_to_point(x, y+3, sz) #O
+            move3 = coord_to_point(x, y+2, sz)  #O
+            move4 = coord_to_point(x, y+1, sz)  #O
+            xmove = coord_to_point(x, y, sz) #X
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == EMPTY:
                 captures.append(xmove) #XOO.
 
-        if (board.size >=y-3>=0) and (board.size >= y+1 >= 0) : #.OOOO
-            move1 = coord_to_point(x, y-1, self.board.size) #O
-            move2 = coord_to_point(x, y-3, self.board.size) #O
-            move3 = coord_to_point(x, y-2, self.board.size)  #O
-            move4 = coord_to_point(x, y+1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size) #X
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == EMPTY:
+        if (sz >=y-3>=0) and (sz >= y+1 >= 0) : #.OOOO
+            move1 = coord_to_point(x, y-1, sz) #O
+            move2 = coord_to_point(x, y-3, sz) #O
+            move3 = coord_to_point(x, y-2, sz)  #O
+            move4 = coord_to_point(x, y+1, sz)  #O
+            xmove = coord_to_point(x, y, sz) #X
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == EMPTY:
                 captures.append(xmove) #XOO.
 
     # Check diagonally 
-        if (board.size >=y+4>=0) and (board.size>=x+4>=0) : #.OOOO
-            move1 = coord_to_point(x+4, y+4, self.board.size) #O
-            move2 = coord_to_point(x+3, y+3, self.board.size) #O
-            move3 = coord_to_point(x+2, y+2, self.board.size)  #O
-            move4 = coord_to_point(x+1, y+1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size) #X
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == 0:
+        if (sz >=y+4>=0) and (sz>=x+4>=0) : #.OOOO
+            move1 = coord_to_point(x+4, y+4, sz) #O
+            move2 = coord_to_point(x+3, y+3, sz) #O
+            move3 = coord_to_point(x+2, y+2, sz)  #O
+            move4 = coord_to_point(x+1, y+1, sz)  #O
+            xmove = coord_to_point(x, y, sz) #X
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == 0:
                 captures.append(xmove) #XOO.
 
-        if (board.size >=y+4>=0) : #.OOOO
-            move1 = coord_to_point(x-4, y-4, self.board.size) #O
-            move2 = coord_to_point(x-3, y-3, self.board.size) #O
-            move3 = coord_to_point(x-2, y-2, self.board.size)  #O
-            move4 = coord_to_point(x-1, y-1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size) #X
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == 0:
+        if (sz >=y+4>=0) : #.OOOO
+            move1 = coord_to_point(x-4, y-4, sz) #O
+            move2 = coord_to_point(x-3, y-3, sz) #O
+            move3 = coord_to_point(x-2, y-2, sz)  #O
+            move4 = coord_to_point(x-1, y-1, sz)  #O
+            xmove = coord_to_point(x, y, sz) #X
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == 0:
                 captures.append(xmove) #XOO.
 
     # Check diagonally 
-        if (board.size >= x+4>=0 and board.size >= y-1 >=0) :
-            move1 = coord_to_point(x+3, y-3, self.board.size) #X
-            move2 = coord_to_point(x+2, y-2, self.board.size)  #O
-            move3 = coord_to_point(x+1, y-1, self.board.size)  #O
-            move4 = coord_to_point(x+4, y-4, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == 0:
+        if (sz >= x+4>=0 and sz >= y-1 >=0) :
+            move1 = coord_to_point(x+3, y-3, sz) #X
+            move2 = coord_to_point(x+2, y-2, sz)  #O
+            move3 = coord_to_point(x+1, y-1, sz)  #O
+            move4 = coord_to_point(x+4, y-4, sz)  #O
+            xmove = coord_to_point(x, y, sz)
+
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == 0:
                 captures.append(xmove) #XOO.
-        if (board.size >= x-4 >=0 and board.size>=y+4 >= 0):
-            move1 = coord_to_point(x-3, y+3, self.board.size) #X
-            move2 = coord_to_point(x-2, y+2, self.board.size)  #O
-            move3 = coord_to_point(x-1, y+1, self.board.size)  #O
-            move4 = coord_to_point(x-4, y+4, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == 0:
+        if (sz >= x-4 >=0 and sz>=y+4 >= 0):
+            move1 = coord_to_point(x-3, y+3, sz) #X
+            move2 = coord_to_point(x-2, y+2, sz)  #O
+            move3 = coord_to_point(x-1, y+1, sz)  #O
+            move4 = coord_to_point(x-4, y+4, sz)  #O
+            xmove = coord_to_point(x, y, sz)
+
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == 0:
                 captures.append(xmove) #XOO.
 
         #3
-        if (board.size >= x+3>=0 and  board.size>= x-1 >= 0 and board.size >= y-1 >=0 and  board.size>= y+3 >= 0):
-            move1 = coord_to_point(x+3, y+3, self.board.size) #O
-            move2 = coord_to_point(x+2, y+2, self.board.size)  #O
-            move3 = coord_to_point(x+1, y+1, self.board.size)  #O
-            move4 = coord_to_point(x-1, y-1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == 0:
+        if (sz >= x+3>=0 and  sz>= x-1 >= 0 and sz >= y-1 >=0 and  sz>= y+3 >= 0):
+            move1 = coord_to_point(x+3, y+3, sz) #O
+            move2 = coord_to_point(x+2, y+2, sz)  #O
+            move3 = coord_to_point(x+1, y+1, sz)  #O
+            move4 = coord_to_point(x-1, y-1, sz)  #O
+            xmove = coord_to_point(x, y, sz)
+
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == 0:
                 captures.append(xmove) #XOO.
-        if (board.size >= x-3>=0 and  board.size>= x+1 >= 0 and board.size >= y+3 >=0 and  board.size>= y-1 >= 0):
-            move1 = coord_to_point(x-3, y+3, self.board.size) #O
-            move2 = coord_to_point(x-2, y+2, self.board.size)  #O
-            move3 = coord_to_point(x-1, y+1, self.board.size)  #O
-            move4 = coord_to_point(x+1, y-1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == 0:
+        if (sz >= x-3>=0 and  sz>= x+1 >= 0 and sz >= y+3 >=0 and  sz>= y-1 >= 0):
+            move1 = coord_to_point(x-3, y+3, sz) #O
+            move2 = coord_to_point(x-2, y+2, sz)  #O
+            move3 = coord_to_point(x-1, y+1, sz)  #O
+            move4 = coord_to_point(x+1, y-1, sz)  #O
+            xmove = coord_to_point(x, y, sz)
+
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == 0:
                 captures.append(xmove) #XOO.
         #4
-        if (board.size >= x+2>=0 and  board.size>= x-2 >= 0 and board.size >= y+2>=0 and  board.size>= y-2 >= 0):
-            move1 = coord_to_point(x+2, y+2, self.board.size) #X
-            move2 = coord_to_point(x+1, y+1, self.board.size)  #O
-            move3 = coord_to_point(x-1, y-1, self.board.size)  #O
-            move4 = coord_to_point(x-2, y-2, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == 0:
+        if (sz >= x+2>=0 and  sz>= x-2 >= 0 and sz >= y+2>=0 and  sz>= y-2 >= 0):
+            move1 = coord_to_point(x+2, y+2, sz) #X
+            move2 = coord_to_point(x+1, y+1, sz)  #O
+            move3 = coord_to_point(x-1, y-1, sz)  #O
+            move4 = coord_to_point(x-2, y-2, sz)  #O
+            xmove = coord_to_point(x, y, sz)
+
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == 0:
                 captures.append(xmove) #XOO.
-        if (board.size >= x+2>=0 and  board.size>= x-2 >= 0 and board.size >= y+2 >=0 and board.size >= y-2 >= 0):
-            move1 = coord_to_point(x-2, y+2, self.board.size) #X
-            move2 = coord_to_point(x-1, y+1, self.board.size)  #O
-            move3 = coord_to_point(x+1, y-1, self.board.size)  #O
-            move4 = coord_to_point(x+2, y-2, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == 0:
+        if (sz >= x+2>=0 and  sz>= x-2 >= 0 and sz >= y+2 >=0 and sz >= y-2 >= 0):
+            move1 = coord_to_point(x-2, y+2, sz) #X
+            move2 = coord_to_point(x-1, y+1, sz)  #O
+            move3 = coord_to_point(x+1, y-1, sz)  #O
+            move4 = coord_to_point(x+2, y-2, sz)  #O
+            xmove = coord_to_point(x, y, sz)
+
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == 0:
                 captures.append(xmove) #XOO.
         #5
-        if (board.size >= x+3>=0 and  board.size>= x-1 >= 0 and board.size >= y-3 >= 0 and board.size>= y+1 >=0):
-            move1 = coord_to_point(x+1, y+1, self.board.size) #X
-            move2 = coord_to_point(x-1, y-1, self.board.size)  #O
-            move3 = coord_to_point(x-2, y-2, self.board.size)  #O
-            move4 = coord_to_point(x-3, y-3, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == 0:
+        if (sz >= x+3>=0 and  sz>= x-1 >= 0 and sz >= y-3 >= 0 and sz>= y+1 >=0):
+            move1 = coord_to_point(x+1, y+1, sz) #X
+            move2 = coord_to_point(x-1, y-1, sz)  #O
+            move3 = coord_to_point(x-2, y-2, sz)  #O
+            move4 = coord_to_point(x-3, y-3, sz)  #O
+            xmove = coord_to_point(x, y, sz)
+
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == 0:
                 captures.append(xmove) #XOO.
-        if (board.size >= x+3>=0 and  board.size>= x-1 >= 0 and board.size >= y-3 >=0 and  board.size>= y+1 >= 0):
-            move1 = coord_to_point(x-1, y+1, self.board.size) #X
-            move2 = coord_to_point(x+1, y-1, self.board.size)  #O
-            move3 = coord_to_point(x+2, y-2, self.board.size)  #O
-            move4 = coord_to_point(x+3, y-3, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-
-            if (board.get_color(move1) == opp ) and board.get_color(move2) == opp and board.get_color(move3) == opp and board.get_color(move4) == opp and board.get_color(xmove) == 0:
+        if (sz >= x+3>=0 and  sz>= x-1 >= 0 and sz >= y-3 >=0 and  sz>= y+1 >= 0):
+            move1 = coord_to_point(x-1, y+1, sz) #X
+            move2 = coord_to_point(x+1, y-1, sz)  #O
+            move3 = coord_to_point(x+2, y-2, sz)  #O
+            move4 = coord_to_point(x+3, y-3, sz)  #O
+            xmove = coord_to_point(x, y, sz)
+
+            if (gc(move1) == opp ) and gc(move2) == opp and gc(move3) == opp and gc(move4) == opp and gc(xmove) == 0:
                 captures.append(xmove) #XOO.
         return captures
     
-    def get_open_four_moves(self, board: GoBoard, color: GO_COLOR) -> List[str]:
-        open_four_moves = []
-        for move in GoBoardUtil.generate_legal_moves(board, color):
-            captured_stones = self.check_open_four_moves(board, move, color)
-
-            if captured_stones:
-                coords: Tuple[int, int] = point_to_coord(move, board.size)
-                open_four_moves.append(format_point(coords).lower())
-
-        return open_four_moves
-
-
     def check_open_four_moves (self, board: GoBoard, move: GO_POINT, color: GO_COLOR):
-        x, y = point_to_coord(move, board.size)
+        size = board.size
+        gc = board.get_color
+        NS = board.NS
+        x = move // NS
+        y = move - x * NS
 
         openfour = []
-        size = board.size
         # horizontal
         if (0<= x-1 < size and 0<= x+2 <size):
-            move1 = coord_to_point(x-1, y, self.board.size) #X
-            move2 = coord_to_point(x+1, y, self.board.size)  #O
-            move3 = coord_to_point(x+2, y, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == color and board.get_color(move3) == color and board.get_color(xmove) == 0:
+            move1 = coord_to_point(x-1, y, size) #X
+            move2 = coord_to_point(x+1, y, size)  #O
+            move3 = coord_to_point(x+2, y, size)  #O
+            xmove = coord_to_point(x, y, size)
+            if (gc(move1) == color ) and gc(move2) == color and gc(move3) == color and gc(xmove) == 0:
                 openfour.append(xmove) #XOO.
         if (0<= x-2 < size and 0<= x+1 <size):
-            move1 = coord_to_point(x+1, y, self.board.size) #X
-            move2 = coord_to_point(x-1, y, self.board.size)  #O
-            move3 = coord_to_point(x-2, y, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == color and board.get_color(move3) == color and board.get_color(xmove) == 0:
+            move1 = coord_to_point(x+1, y, size) #X
+            move2 = coord_to_point(x-1, y, size)  #O
+            move3 = coord_to_point(x-2, y, size)  #O
+            xmove = coord_to_point(x, y, size)
+            if (gc(move1) == color ) and gc(move2) == color and gc(move3) == color and gc(xmove) == 0:
                 openfour.append(xmove) #XOO.
         if (0<= x-3 < size):
-            move1 = coord_to_point(x-1, y, self.board.size) #X
-            move2 = coord_to_point(x-2, y, self.board.size)  #O
-            move3 = coord_to_point(x-3, y, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == color and board.get_color(move3) == color and board.get_color(xmove) == 0:
+            move1 = coord_to_point(x-1, y, size) #X
+            move2 = coord_to_point(x-2, y, size)  #O
+            move3 = coord_to_point(x-3, y, size)  #O
+            xmove = coord_to_point(x, y, size)
+            if (gc(move1) == color ) and gc(move2) == color and gc(move3) == color and gc(xmove) == 0:
                 openfour.append(xmove) #XOO.
 
         if (0<= x+3 < size):
-            move1 = coord_to_point(x+3, y, self.board.size) #X
-            move2 = coord_to_point(x+2, y, self.board.size)  #O
-            move3 = coord_to_point(x+1, y, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == color and board.get_color(move3) == color and board.get_color(xmove) == 0:
+            move1 = coord_to_point(x+3, y, size) #X
+            move2 = coord_to_point(x+2, y, size)  #O
+            move3 = coord_to_point(x+1, y, size)  #O
+            xmove = coord_to_point(x, y, size)
+            if (gc(move1) == color ) and gc(move2) == color and gc(move3) == color and gc(xmove) == 0:
                 openfour.append(xmove) #XOO.
         #vertical
         if (0<= y-3< size):
-            move1 = coord_to_point(x, y-1, self.board.size) #X
-            move2 = coord_to_point(x, y-2, self.board.size)  #O
-            move3 = coord_to_point(x, y-3, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == color and board.get_color(move3) == color and board.get_color(xmove) == 0:
+            move1 = coord_to_point(x, y-1, size) #X
+            move2 = coord_to_point(x, y-2, size)  #O
+            move3 = coord_to_point(x, y-3, size)  #O
+            xmove = coord_to_point(x, y, size)
+            if (gc(move1) == color ) and gc(move2) == color and gc(move3) == color and gc(xmove) == 0:
                 openfour.append(xmove) #XOO.
         if (0<= y-2 < size and 0<= y+1 <size):
-            move1 = coord_to_point(x, y+1, self.board.size) #X
-            move2 = coord_to_point(x, y-1, self.board.size)  #O
-            move3 = coord_to_point(x, y-2, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == color and board.get_color(move3) == color and board.get_color(xmove) == 0:
+            move1 = coord_to_point(x, y+1, size) #X
+            move2 = coord_to_point(x, y-1, size)  #O
+            move3 = coord_to_point(x, y-2, size)  #O
+            xmove = coord_to_point(x, y, size)
+            if (gc(move1) == color ) and gc(move2) == color and gc(move3) == color and gc(xmove) == 0:
                 openfour.append(xmove) #XOO.
         if (0<= y+3 < size):
-            move1 = coord_to_point(x, y+3, self.board.size) #X
-            move2 = coord_to_point(x, y+2, self.board.size)  #O
-            move3 = coord_to_point(x, y+1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == color and board.get_color(move3) == color and board.get_color(xmove) == 0:
+            move1 = coord_to_point(x, y+3, size) #X
+            move2 = coord_to_point(x, y+2, size)  #O
+            move3 = coord_to_point(x, y+1, size)  #O
+            xmove = coord_to_point(x, y, size)
+            if (gc(move1) == color ) and gc(move2) == color and gc(move3) == color and gc(xmove) == 0:
                 openfour.append(xmove) #XOO.
 
         if (0<= y-1 < size) and (0<= y+2 < size):
-            move1 = coord_to_point(x, y+2, self.board.size) #X
-            move2 = coord_to_point(x, y+1, self.board.size)  #O
-            move3 = coord_to_point(x, y-1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == color and board.get_color(move3) == color and board.get_color(xmove) == 0:
+            move1 = coord_to_point(x, y+2, size) #X
+            move2 = coord_to_point(x, y+1, size)  #O
+            move3 = coord_to_point(x, y-1, size)  #O
+            xmove = coord_to_point(x, y, size)
+            if (gc(move1) == color ) and gc(move2) == color and gc(move3) == color and gc(xmove) == 0:
                 openfour.append(xmove) #XOO.
 
         # Check diagonally (left down to right up) for x.xx
         if (0<= x+3 < size and 0<= y+3 <size):
-            move1 = coord_to_point(x+3, y+3, self.board.size) #X
-            move2 = coord_to_point(x+2, y+2, self.board.size)  #O
-            move3 = coord_to_point(x+1, y+1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == color and board.get_color(move3) == color and board.get_color(xmove) == 0:
+            move1 = coord_to_point(x+3, y+3, size) #X
+            move2 = coord_to_point(x+2, y+2, size)  #O
+            move3 = coord_to_point(x+1, y+1, size)  #O
+            xmove = coord_to_point(x, y, size)
+            if (gc(move1) == color ) and gc(move2) == color and gc(move3) == color and gc(xmove) == 0:
                 openfour.append(xmove) #XOO.
         if (0<= x-1 < size and  0<= x+2 < size and 0<= y-1 < size and 0<= y+2 <size):
-            move1 = coord_to_point(x+2, y+2, self.board.size) #X
-            move2 = coord_to_point(x+1, y+1, self.board.size)  #O
-            move3 = coord_to_point(x-1, y-1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == color and board.get_color(move3) == color and board.get_color(xmove) == 0:
+            move1 = coord_to_point(x+2, y+2, size) #X
+            move2 = coord_to_point(x+1, y+1, size)  #O
+            move3 = coord_to_point(x-1, y-1, size)  #O
+            xmove = coord_to_point(x, y, size)
+            if (gc(move1) == color ) and gc(move2) == color and gc(move3) == color and gc(xmove) == 0:
                 openfour.append(xmove) #XOO.
         if (0<= x-3 < size) and (0<= y-3 < size):
-            move1 = coord_to_point(x-1, y-1, self.board.size) #X
-            move2 = coord_to_point(x-2, y-2, self.board.size)  #O
-            move3 = coord_to_point(x-3, y-3, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == color and board.get_color(move3) == color and board.get_color(xmove) == 0:
+            move1 = coord_to_point(x-1, y-1, size) #X
+            move2 = coord_to_point(x-2, y-2, size)  #O
+            move3 = coord_to_point(x-3, y-3, size)  #O
+            xmove = coord_to_point(x, y, size)
+            if (gc(move1) == color ) and gc(move2) == color and gc(move3) == color and gc(xmove) == 0:
                 openfour.append(xmove) #XOO.
 
         if (0<= x-2 < size and  0<= x+1 < size and 0<= y-2 < size and 0<= y+1 <size):
-            move1 = coord_to_point(x+1, y+1, self.board.size) #X
-            move2 = coord_to_point(x-1, y-1, self.board.size)  #O
-            move3 = coord_to_point(x-2, y-2, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == color and board.get_color(move3) == color and board.get_color(xmove) == 0:
+            move1 = coord_to_point(x+1, y+1, size) #X
+            move2 = coord_to_point(x-1, y-1, size)  #O
+            move3 = coord_to_point(x-2, y-2, size)  #O
+            xmove = coord_to_point(x, y, size)
+            if (gc(move1) == color ) and gc(move2) == color and gc(move3) == color and gc(xmove) == 0:
                 openfour.append(xmove) #XOO.
 
 
         #other way of diagonal 
         if (0<= x-3< size and 0<= y+3 <size):
-            move1 = coord_to_point(x-1, y+1, self.board.size) #X
-            move2 = coord_to_point(x-2, y+2, self.board.size)  #O
-            move3 = coord_to_point(x-3, y+3, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == color and board.get_color(move3) == color and board.get_color(xmove) == 0:
+            move1 = coord_to_point(x-1, y+1, size) #X
+            move2 = coord_to_point(x-2, y+2, size)  #O
+            move3 = coord_to_point(x-3, y+3, size)  #O
+            xmove = coord_to_point(x, y, size)
+            if (gc(move1) == color ) and gc(move2) == color and gc(move3) == color and gc(xmove) == 0:
                 openfour.append(xmove) #XOO.
         if (0<= x+3 < size and 0<= y-3 <size):
-            move1 = coord_to_point(x+3, y-3, self.board.size) #X
-            move2 = coord_to_point(x+2, y-2, self.board.size)  #O
-            move3 = coord_to_point(x+1, y-1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == color and board.get_color(move3) == color and board.get_color(xmove) == 0:
+            move1 = coord_to_point(x+3, y-3, size) #X
+            move2 = coord_to_point(x+2, y-2, size)  #O
+            move3 = coord_to_point(x+1, y-1, size)  #O
+            xmove = coord_to_point(x, y, size)
+            if (gc(move1) == color ) and gc(move2) == color and gc(move3) == color and gc(xmove) == 0:
                 openfour.append(xmove) #XOO.
         if (0<= x-2 < size and  0<= x+1 < size and 0<= y-1 < size and 0<= y+2 <size):
-            move1 = coord_to_point(x+1, y-1, self.board.size) #X
-            move2 = coord_to_point(x-1, y+1, self.board.size)  #O
-            move3 = coord_to_point(x-2, y+2, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == color and board.get_color(move3) == color and board.get_color(xmove) == 0:
+            move1 = coord_to_point(x+1, y-1, size) #X
+            move2 = coord_to_point(x-1, y+1, size)  #O
+            move3 = coord_to_point(x-2, y+2, size)  #O
+            xmove = coord_to_point(x, y, size)
+            if (gc(move1) == color ) and gc(move2) == color and gc(move3) == color and gc(xmove) == 0:
                 openfour.append(xmove) #XOO.
 
         if (0<= x-1 < size and  0<= x+2 < size and 0<= y-2 < size and 0<= y+1 <size):
-            move1 = coord_to_point(x+2, y-2, self.board.size) #X
-            move2 = coord_to_point(x+1, y-1, self.board.size)  #O
-            move3 = coord_to_point(x-1, y+1, self.board.size)  #O
-            xmove = coord_to_point(x, y, self.board.size)
-            if (board.get_color(move1) == color ) and board.get_color(move2) == color and board.get_color(move3) == color and board.get_color(xmove) == 0:
+            move1 = coord_to_point(x+2, y-2, size) #X
+            move2 = coord_to_point(x+1, y-1, size)  #O
+            move3 = coord_to_point(x-1, y+1, size)  #O
+            xmove = coord_to_point(x, y, size)
+            if (gc(move1) == color ) and gc(move2) == color and gc(move3) == color and gc(xmove) == 0:
                 openfour.append(xmove) #XOO.
         return openfour
         
         
-    def get_winning_moves(self, board: GoBoard, color: GO_COLOR) -> list:
-        winning_moves = []
-
-        # Check for winning by five in a row
-        for move in GoBoardUtil.generate_legal_moves(board, color):
-            board_copy = board.copy()
-            board_copy.play_move(move, color)
-            if board_copy.detect_five_in_a_row() == color:
-                coords: Tuple[int, int] = point_to_coord(move, self.board.size)
-                winning_moves.append(format_point(coords).lower())
-
-    # Check for winning by ten or more captures
-        for move in GoBoardUtil.generate_legal_moves(board, color):
-            board_copy = board.copy()
-            board_copy.play_move(move, color)
-            if board_copy.get_captures(color) >= 10:
-                coords: Tuple[int, int] = point_to_coord(move, self.board.size)
-                winning_moves.append(format_point(coords).lower())
-
-        return winning_moves
-    
     # def get_capture_moves(self,board: GoBoard, color: GO_COLOR) -> List[str]:
     #     capture_moves = []
 
@@ -1155,7 +1036,10 @@ class GtpConnection:
         Modify this function for Assignment 2.
         """
         board_color = args[0].lower()
-        color = color_to_int(board_color)
+        color = _COLOR_MAP.get(board_color)
+        if color is None:
+            self.error(self.argmap["genmove"][1])
+            return
         result1 = self.board.detect_five_in_a_row()
         result2 = EMPTY
         if self.board.get_captures(opponent(color)) >= 10:
@@ -1179,8 +1063,7 @@ class GtpConnection:
             # move_as_string = random.choice(policy_moves)
             # self.play_cmd([board_color, move_as_string, 'print_move'])
             move_as_string = self.flat_monte_carlo_simulation(color, legal_moves)
-            coords: Tuple[int, int] = point_to_coord(move_as_string, self.board.size)
-            moves = (format_point(coords).lower())
+            moves = self._fmt_table[move_as_string]
             
             self.play_cmd([board_color, moves, 'print_move'])
 
@@ -1244,16 +1127,43 @@ def format_point(move: Tuple[int, int]) -> str:
     """
     Return move coordinates as a string such as 'A1', or 'PASS'.
     """
-    assert MAXSIZE <= 25
-    column_letters = "ABCDEFGHJKLMNOPQRSTUVWXYZ"
     if move[0] == PASS:
         return "PASS"
     row, col = move
     if not 0 <= row < MAXSIZE or not 0 <= col < MAXSIZE:
         raise ValueError
-    return column_letters[col - 1] + str(row)
+    return _COLUMN_LETTERS[col - 1] + str(row)
 
 
+def point_to_gtp(point: GO_POINT, boardsize: int) -> str:
+    """
+    Return point as a GTP string such as 'A1', or 'PASS'.
+    Same as format_point(point_to_coord(point, boardsize)),
+    without building the intermediate (row, col) tuple.
+    """
+    if point == PASS:
+        return "PASS"
+    NS = boardsize + 1
+    row = point // NS
+    return _COLUMN_LETTERS[point - row * NS - 1] + str(row)
+
+
+@lru_cache(maxsize=32)
+def _get_format_table(boardsize: int) -> Tuple[str, ...]:
+    """
+    Lowercase GTP strings such as 'a1' for all points of a board,
+    indexed by point. Points off the board map to "".
+    """
+    NS = boardsize + 1
+    table = [""] * board_array_size(boardsize)
+    for row in range(1, boardsize + 1):
+        for col in range(1, boardsize + 1):
+            point = row * NS + col
+            table[point] = point_to_gtp(point, boardsize).lower()
+    return tuple(table)
+
+
+@lru_cache(maxsize=4096)
 def move_to_coord(point_str: str, board_size: int) -> Tuple[int, int]:
     """
     Convert a string point_str representing a point, as specified by GTP,
@@ -1262,27 +1172,35 @@ def move_to_coord(point_str: str, board_size: int) -> Tuple[int, int]:
     """
     if not 2 <= board_size <= MAXSIZE:
         raise ValueError("board_size out of range")
-    s = point_str.lower()
-    if s == "pass":
-        return (PASS, PASS)
-    try:
-        col_c = s[0]
-        if (not "a" <= col_c <= "z") or col_c == "i":
-            raise ValueError
-        col = ord(col_c) - ord("a")
-        if col_c < "i":
-            col += 1
-        row = int(s[1:])
-        if row < 1:
-            raise ValueError
-    except (IndexError, ValueError):
-        raise ValueError("wrong coordinate")
-    if not (col <= board_size and row <= board_size):
+    return _move_parser(board_size)(point_str)
+
+
+@lru_cache(maxsize=32)
+def _move_parser(board_size: int) -> Callable[[str], Tuple[int, int]]:
+    """
+    move_to_coord specialized for one board size.
+    Only the rows and columns of this board are in its tables,
+    so they need no separate range checks.
+    """
+    columns = {code: col for code, col in _GTP_COL.items() if col <= board_size}
+    rows = {str(row): row for row in range(1, board_size + 1)}
+
+    def parse(point_str: str) -> Tuple[int, int]:
+        # only a 4 character string can be a pass, so only those are lowercased
+        if len(point_str) == 4 and point_str.lower() == "pass":
+            return (PASS, PASS)
+        # leading zeros are allowed, as in "a01"
+        row = rows.get(point_str[1:].lstrip("0"))
+        if row is not None:
+            # | 0x20 maps upper case letters to lower case
+            col = columns.get(ord(point_str[0]) | 0x20)
+            if col is not None:
+                return row, col
         raise ValueError("wrong coordinate")
-    return row, col
+
+    return parse
 
 
 def color_to_int(c: str) -> int:
     """convert character to the appropriate integer code"""
-    color_to_int = {"b": BLACK, "w": WHITE, "e": EMPTY, "BORDER": BORDER}
-    return color_to_int[c]
+    return _COLOR_CODES[c]
@@ -0,0 +1,99 @@
+"""
+patterns_numba.py
+Compiled pattern scanners for the rule-based policy in gtp_connection.py.
+
+The kernels work directly on the padded 1-d board array of GoBoard
+(see coord_to_point in board_base.py for the encoding).
+If numba is not installed, they run as plain Python functions.
+"""
+import numpy as np
+
+from board_base import BLACK, WHITE, EMPTY
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """ Fallback decorator: return the function unchanged """
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda f: f
+
+
+@njit(cache=True)
+def _pattern_code(color: int, length: int) -> int:
+    """
+    The colors O ... O X of the pattern X O ... O ., read outwards
+    from the empty point, packed 2 bits per point as in _scan_pattern.
+    """
+    opp = WHITE + BLACK - color
+    code = 0
+    for k in range(length - 1):
+        code |= opp << (2 * k)
+    return code | (color << (2 * (length - 1)))
+
+
+@njit(cache=True)
+def _scan_pattern(board: np.ndarray, size: int, move: int, color: int, length: int) -> int:
+    """
+    Match the pattern X O ... O . in all 8 directions, with
+    length - 1 opponent stones between the empty point move and a
+    stone X of color.
+    Returns a bitmask with bit i set if direction i matches.
+    All colors fit in 2 bits, so the length points in a direction are
+    packed into one integer and compared with the pattern in one step.
+    Points past the edge of the array are clipped; the BORDER point
+    in front of them never matches, so the pattern fails anyway.
+    """
+    if board[move] != EMPTY:
+        return 0
+    code = _pattern_code(color, length)
+    last = board.shape[0] - 1
+    ns = size + 1
+    offsets = (1, -1, ns, -ns, ns + 1, ns - 1, -ns - 1, -ns + 1)
+    mask = 0
+    for i in range(8):
+        offset = offsets[i]
+        packed = 0
+        for k in range(length):
+            p = min(max(move + (k + 1) * offset, 0), last)
+            packed |= board[p] << (2 * k)
+        if packed == code:
+            mask |= 1 << i
+    return mask
+
+
+@njit(cache=True)
+def scan_capture_xoo(board: np.ndarray, size: int, move: int, color: int) -> int:
+    """ Directions in which playing color on move captures: X O O . """
+    return _scan_pattern(board, size, move, color, 3)
+
+
+@njit(cache=True)
+def scan_xooox(board: np.ndarray, size: int, move: int, color: int) -> int:
+    """ Directions in which move closes the pattern X O O O . """
+    return _scan_pattern(board, size, move, color, 4)
+
+
+@njit(cache=True)
+def makes_five(board: np.ndarray, size: int, move: int, color: int) -> bool:
+    """
+    Whether playing color on move makes five or more in a row through move.
+    Stones captured by the move are never of color, so they do not matter.
+    """
+    ns = size + 1
+    offsets = (1, ns, ns + 1, ns - 1)
+    for i in range(4):
+        offset = offsets[i]
+        count = 1
+        p = move + offset
+        while board[p] == color:
+            count += 1
+            p += offset
+        p = move - offset
+        while board[p] == color:
+            count += 1
+            p -= offset
+        if count >= 5:
+            return True
+    return False